@@ -26,6 +26,7 @@ from datalad_next.constraints import (
     EnsureURL
 )
 from datalad_next.constraints.dataset import EnsureDataset
+from datalad_next.datasets import LegacyAnnexRepo as AnnexRepo
 
 
 lgr = logging.getLogger('datalad.dataverse.add_sibling_dataverse')
@@ -204,10 +205,29 @@ class AddSiblingDataverse(ValidatedInterface):
         if mode != 'git-only' and not storage_name:
             storage_name = "{}-storage".format(name)
 
-        sibling_names = set(
-            r['name'] for r in ds.siblings(result_renderer='disabled'))
-        sibling_conflicts = \
-            set((name, storage_name)).intersection(sibling_names)
+        if storage_name == name \
+                and mode not in ('git-only', 'annex-only', 'filetree-only'):
+            # both siblings would be set up under the same remote name,
+            # fail before touching the repository
+            raise ValueError(
+                'sibling name and storage sibling name must differ')
+
+        # we only need the names for conflict detection. These come
+        # straight from the (already loaded) Git config, no need to run
+        # a full `siblings()` query. Like `siblings()`, consider 'here'
+        # (the local dataset) taken
+        sibling_names = frozenset(ds.repo.get_remotes()) | {'here'}
+        sibling_conflicts = sibling_names.intersection((name, storage_name))
+        if mode != 'git-only' and storage_name not in sibling_conflicts \
+                and isinstance(ds.repo, AnnexRepo) \
+                and storage_name in (
+                    sr.get('name')
+                    for sr in ds.repo.get_special_remotes().values()):
+            # the storage sibling name may also be taken by a special remote
+            # that git-annex knows about, but that is not enabled in this
+            # clone (hence not among the Git remotes). This is no conflict
+            # for the Git sibling, which is no special remote
+            sibling_conflicts |= {storage_name}
         # TODO this should be implemented as a joint-validation
         # if instructed to error on any existing sibling with a
         # matching name, do immediately
@@ -226,7 +246,7 @@ class AddSiblingDataverse(ValidatedInterface):
                 existing=existing,
                 sibling_conflicts=sibling_conflicts,
         ):
-            yield dict(res_kwargs, **res)
+            yield {**res_kwargs, **res}
 
     @staticmethod
     def custom_result_renderer(res, **kwargs):
@@ -242,15 +262,15 @@ class AddSiblingDataverse(ValidatedInterface):
             generic_result_renderer(res)
             return
 
-        ui.message('{action}({status}): {path} [{name}{url}{doi}]'.format(
-            action=ac.color_word(res['action'], ac.BOLD),
-            path=relpath(res['path'], res['refds'])
-            if 'refds' in res else res['path'],
-            name=ac.color_word(res.get('name', ''), ac.MAGENTA),
-            url=f": {res['url']}" if 'url' in res else '',
-            doi=f" (DOI: {res['doi']})" if 'doi' in res else '',
-            status=ac.color_status(res['status']),
-        ))
+        color_word = ac.color_word
+        action = color_word(res['action'], ac.BOLD)
+        status = ac.color_status(res['status'])
+        path = relpath(res['path'], res['refds']) \
+            if 'refds' in res else res['path']
+        name = color_word(res.get('name', ''), ac.MAGENTA)
+        url = f": {res['url']}" if 'url' in res else ''
+        doi = f" (DOI: {res['doi']})" if 'doi' in res else ''
+        ui.message(f'{action}({status}): {path} [{name}{url}{doi}]')
 
 
 def _add_sibling_dataverse(
@@ -261,7 +281,7 @@ def _add_sibling_dataverse(
         name=None,
         storage_name=None,
         existing='error',
-        sibling_conflicts=set(),
+        sibling_conflicts=frozenset(),
 ):
     """
     meant to be executed via foreach-dataset
@@ -275,7 +295,7 @@ def _add_sibling_dataverse(
     name: str, optional
     storage_name: str, optional
     existing: str, optional
-    sibling_conflicts: set, optional
+    sibling_conflicts: frozenset, optional
     """
     # Set up the actual remotes
     # simplify downstream logic, export yes or no
@@ -346,26 +366,34 @@ def _add_git_sibling(
         yield _get_skip_sibling_result(name, ds, 'git')
         return
 
-    remote_url = \
-        "datalad-annex::?type=external&externaltype=dataverse&encryption=none" \
-        "&exporttree={export}&url={url}&doi={doi}".format(
-            export='yes' if export else 'no',
-            # urlquote, because it goes into the query part of another URL
-            url=urlquote(url),
-            doi=doi)
-
+    url_props = [
+        "type=external",
+        "externaltype=dataverse",
+        "encryption=none",
+        f"exporttree={'yes' if export else 'no'}",
+        # urlquote, because it goes into the query part of another URL
+        f"url={urlquote(url)}",
+        f"doi={doi}",
+    ]
     if credential_name:
         # we need to quote the credential name too.
         # e.g., it is not uncommon for credentials to be named after URLs
-        remote_url += f'&credential={urlquote(credential_name)}'
+        url_props.append(f'credential={urlquote(credential_name)}')
 
     if root_path:
-        remote_url += f'&rootpath={urlquote(str(root_path))}'
+        url_props.append(f'rootpath={urlquote(str(root_path))}')
+
+    remote_url = f"datalad-annex::?{'&'.join(url_props)}"
 
     # announce the sibling to not have an annex (we have a dedicated
     # storage sibling for that) to avoid needless annex-related processing
-    # and speculative whining by `siblings()`
-    ds.config.set(f'remote.{name}.annex-ignore', 'true', scope='local')
+    # and speculative whining by `siblings()`.
+    # no config reload needed, `siblings()` reloads when it sets the URL,
+    # before it gets to inspect this setting.
+    # a reconfigured sibling will have it already, spare the `git config` call
+    annex_ignore_var = f'remote.{name}.annex-ignore'
+    if ds.config.get(annex_ignore_var) != 'true':
+        ds.config.set(annex_ignore_var, 'true', scope='local', reload=False)
 
     for r in ds.siblings(
             # action must always be 'configure' (not 'add'), because above we just
@@ -410,9 +438,9 @@ def _add_storage_sibling(
         yield _get_skip_sibling_result(name, ds, 'storage')
         return
 
+    reconfigure = known and existing == 'reconfigure'
     cmd_args = [
-        'enableremote' if known and existing == 'reconfigure'
-        else 'initremote',
+        'enableremote' if reconfigure else 'initremote',
         name,
         "type=external",
         "externaltype=dataverse",
@@ -435,9 +463,8 @@ def _add_storage_sibling(
     yield get_status_dict(
         ds=ds,
         status='ok',
-        action='reconfigure_sibling_dataverse.storage'
-               if known and existing == 'reconfigure' else
-        'add_sibling_dataverse.storage',
+        action='reconfigure_sibling_dataverse.storage' if reconfigure
+        else 'add_sibling_dataverse.storage',
         name=name,
         type='sibling',
         url=url,
@@ -8,23 +8,17 @@ from pathlib import (
     PurePosixPath,
 )
 
-from requests.exceptions import HTTPError
-
 from datalad_next.annexremotes import (
     RemoteError,
     SpecialRemote,
     super_main,
 )
-from datalad_next.credman import CredentialManager
-# this important is a vast overstatement, we only need
-# `AnnexRepo.config`, nothing else
-from datalad_next.datasets import LegacyAnnexRepo as AnnexRepo
-
-from .dataset import OnlineDataverseDataset
-from .utils import (
-    get_native_api,
-    format_doi,
-)
+
+# `OnlineDataverseDataset`, the API utilities, and the credential handling
+# are only imported in `prepare()`. Some special remote processes never
+# get to talk to Dataverse (e.g. when git-annex only queries the
+# supported configuration), and should not pay for importing pyDataverse
+# and its HTTP stack
 
 
 class DataverseRemote(SpecialRemote):
@@ -82,6 +76,21 @@ class DataverseRemote(SpecialRemote):
     # Essential API
     #
     def prepare(self):
+        if self._dvds is not None:
+            # we are already set up (e.g., via initremote()), no need to
+            # obtain a credential and connect again
+            return
+        from datalad_next.credman import CredentialManager
+        # this important is a vast overstatement, we only need
+        # `AnnexRepo.config`, nothing else
+        from datalad_next.datasets import LegacyAnnexRepo as AnnexRepo
+
+        from .dataset import OnlineDataverseDataset
+        from .utils import (
+            get_native_api,
+            format_doi,
+        )
+
         # remove any trailing slash from URL
         url = self.annex.getconfig('url').rstrip('/')
         if not url:
@@ -120,6 +129,13 @@ class DataverseRemote(SpecialRemote):
         # save the credential, now that it has successfully been used
         credman.set(credential_name, _lastused=True, **cred)
 
+    def close(self):
+        # called by datalad_next when the special remote process shuts down
+        if self._dvds is not None:
+            self._dvds.close()
+            self._dvds = None
+        super().close()
+
     def initremote(self):
         """
             Use this command to initialize a remote
@@ -316,6 +332,9 @@ class DataverseRemote(SpecialRemote):
 
     def _upload_file(self, remote_path, key, local_file, replace_id):
         """helper for both transfer-store methods"""
+        # pyDataverse's HTTP stack, already imported by `prepare()`
+        from httpx import HTTPStatusError
+
         if replace_id is not None:
             self.message(f"Replacing fileId {replace_id} ...", type='debug')
         else:
@@ -323,10 +342,10 @@ class DataverseRemote(SpecialRemote):
 
         try:
             upload_id = self._dvds.upload_file(Path(local_file), remote_path, replace_id)
-        except HTTPError as e:
-            if e.response.status_code == 400 and \
-                    e.response.json()['status'] == "ERROR" and \
-                    "duplicate content" in e.response.json()['message']:
+        except HTTPStatusError as e:
+            err = e.response.json() if e.response.status_code == 400 else {}
+            if err.get('status') == "ERROR" and \
+                    "duplicate content" in err.get('message', ''):
                 # Ignore this one for now.
                 # TODO: This needs better handling. Currently, this happens in
                 # git-annex-testremote ("store when already present").
@@ -8,21 +8,20 @@ from pathlib import (
     Path,
     PurePosixPath,
 )
-import re
 
 from looseversion import LooseVersion
 from pyDataverse.api import ApiAuthorizationError
-from pyDataverse.models import Datafile
-from requests import (
-    delete as delete_request,
-    post as post_request,
-)
-from requests.auth import HTTPBasicAuth
 import sys
 
-from pyDataverse.api import DataAccessApi
+from .utils import (
+    _PooledApiMixin,
+    get_data_access_api,
+    mangle_path,
+)
+
 
-from .utils import mangle_path
+# size of the chunks to write downloaded file content in
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 # Object to hold what's on dataverse's end for a given database file id.
@@ -35,11 +34,32 @@ from .utils import mangle_path
 # This namedtuple is meant to be the value type of a dict with ids as its keys:
 @dataclass
 class FileIdRecord:
+    # there can be one instance per file per dataset version, do not have
+    # each carry an instance `__dict__`.
+    # `dataclass(slots=True)` would need Python 3.10
+    __slots__ = ('path', 'is_released', 'is_latest_version')
     path: PurePosixPath
     is_released: bool
     is_latest_version: bool
 
 
+def _get_version_key(version: dict) -> tuple:
+    """Sorting key for records of dataset versions
+
+    Note, that ('versionNumber', 'versionMinorNumber', 'versionState')
+    look like this:
+    (None, None, 'DRAFT'), (2, 0, 'RELEASED'), (1, 0, 'RELEASED')
+    and we need a possible DRAFT to have the greatest key WRT sorting.
+    Minor version numbers can be 0, so test for `None` explicitly.
+    """
+    major = version.get('versionNumber')
+    minor = version.get('versionMinorNumber')
+    return (
+        sys.maxsize if major is None else major,
+        sys.maxsize if minor is None else minor,
+    )
+
+
 class OnlineDataverseDataset:
     """Representation of Dataverse dataset in a remote instance.
 
@@ -69,8 +89,14 @@ class OnlineDataverseDataset:
     requesting a full update again. In case of checking the presence of a file
     that does not appear to be part of the latest version, a request for such a
     record on all known dataverse dataset versions is made.
+
+    The ``api`` handle must be obtained via ``get_native_api()``. Its pooled
+    HTTP client is also used for the requests pyDataverse does not support.
     """
     def __init__(self, api, dsid: str, root_path: str | None = None):
+        if not isinstance(api, _PooledApiMixin):
+            raise TypeError(
+                'dataverse API handle must be obtained via get_native_api()')
         # dataverse native API handle
         self._api = api
         self._dsid = dsid
@@ -80,23 +106,56 @@ class OnlineDataverseDataset:
         self._root_path = PurePosixPath(root_path) if root_path else None
 
         self._data_access_api = None
-        # mapping of dataverse database fileids to FileIdRecord
-        self._file_records = None
+        self._server_version = None
         # flag whether a listing across all dataset versions
         # was already retrieved and incorporated into the file_records
         self._knows_all_versions = False
 
-        # check if instance is readable and authenticated
-        resp = api.get_info_version()
-        if resp.json()['status'] != 'OK':
-            raise RuntimeError(f'Cannot connect to dataverse instance '
-                               f'(status: {resp.json()["status"]})')
-
-        # check if project with specified doi exists
-        # TODO ask for ':latest' and cache?
-        dv_ds = api.get_dataset(identifier=dsid)
+        # check if project with specified doi exists.
+        # this also verifies that the instance is reachable and that
+        # we are authenticated (pyDataverse raises on 401), no need for
+        # a separate round-trip to check.
+        # we only need the file listing of the latest version, not the
+        # entire dataset record. Its metadata blocks can be large, and
+        # are not needed either (older Dataverse versions ignore this
+        # parameter)
+        dv_ds = api.get_request(
+            f'{api.base_url_api_native}/datasets/:persistentId/versions/'
+            ':latest',
+            params={'persistentId': dsid, 'excludeMetadataBlocks': 'true'},
+        )
+        if dv_ds.status_code == 403:
+            # 401 is already raised on by pyDataverse
+            raise RuntimeError("Not permitted to access dataset")
         if not dv_ds.status_code < 400:
             raise RuntimeError("Cannot find dataset")
+        latest_version = dv_ds.json()['data']
+        # mapping of dataverse database fileids to FileIdRecord.
+        # Initially, this is a record of the files in the latest version of
+        # the dataverse dataset, taken from the response above. This refers
+        # to the DRAFT version (if there is any) or the latest published
+        # version otherwise. That's the version pushes go into. Hence, this
+        # is needed to determine whether we need and can replace/remove a
+        # file. If that is not sufficient (e.g., for retrieval of keys that
+        # are not present in the latest version anymore), callers need to
+        # call _ensure_file_records_for_all_versions() first.
+        # Note, that while initially we may not be in a draft, we are as
+        # soon as we change things (upload/replace/remove/rename). We keep
+        # track of those changes herein w/o rerequesting the new state.
+        self._file_records = self._get_file_records_from_version_listing(
+            latest_version,
+            latest=True,
+        )
+        if latest_version['versionState'] == 'RELEASED' \
+                and _get_version_key(latest_version) == (1, 0):
+            # the first ever release is the latest version, there are no
+            # other versions to ask for
+            self._knows_all_versions = True
+        # index of the file records by path, mapping to the fileids with
+        # that path (in order of recording). It spares a scan of all file
+        # records for any path-based query. Must be kept in sync with
+        # `_file_records` via `_set_file_record()`/`_pop_file_record()`.
+        self._index_file_records()
 
     def get_fileid_from_path(
             self, path: PurePosixPath, *, latest_only: bool) -> int | None:
@@ -121,26 +180,23 @@ class OnlineDataverseDataset:
         if not latest_only:
             self._ensure_file_records_for_all_versions()
         path = self._mangle_path(path)
-        # get all file id records that match the path, and are latest version,
-        # if desired
-        match_path = dict(
-            (i, f) for i, f in self._file_records_by_fileid.items()
-            if f.path == path
-            if latest_only is False or f.is_latest_version is True
-        )
-        if not match_path:
-            # no match
-            return None
-        else:
-            # any number of matches, report first one
-            return match_path.popitem()[0]
+        match = None
+        for fid in self._fileids_by_path.get(path, ()):
+            if self._file_records[fid].is_latest_version:
+                # a match in the latest version always wins
+                return fid
+            if not latest_only:
+                # any number of matches in older versions, report the
+                # last one recorded
+                match = fid
+        return match
 
     def has_fileid(self, fid: int) -> bool:
         self._ensure_file_records_for_all_versions()
-        return fid in self._file_records_by_fileid
+        return fid in self._file_records
 
     def has_fileid_in_latest_version(self, fid: int) -> bool:
-        rec = self._file_records_by_fileid.get(fid)
+        rec = self._file_records.get(fid)
         if rec is None:
             return False
         else:
@@ -149,19 +205,17 @@ class OnlineDataverseDataset:
     def has_path(self, path: PurePosixPath) -> bool:
         path = self._mangle_path(path)
         self._ensure_file_records_for_all_versions()
-        return path in set(
-            f.path for f in self._file_records_by_fileid.values()
-        )
+        return path in self._fileids_by_path
 
     def has_path_in_latest_version(self, path: PurePosixPath) -> bool:
         path = self._mangle_path(path)
-        return path in set(
-            f.path for f in self._file_records_by_fileid.values()
-            if f.is_latest_version
+        return any(
+            self._file_records[fid].is_latest_version
+            for fid in self._fileids_by_path.get(path, ())
         )
 
     def is_released_file(self, fid: int) -> bool:
-        rec = self._file_records_by_fileid.get(fid)
+        rec = self._file_records.get(fid)
         if rec is None:
             return False
         else:
@@ -170,54 +224,63 @@ class OnlineDataverseDataset:
     def download_file(self, fid: int, path: Path):
         # pydataverse does not support streaming downloads
         # https://github.com/gdcc/pyDataverse/issues/49
-        # the code below is nevertheless readied for such a
-        # scenario
+        # hence we issue the request via the (pooled) HTTP client of the
+        # data access API directly, to not hold an entire file in memory
+        api = self.data_access_api
+        params = {}
         # for JülichData compatibility while still running on 4.20, a
         # version-dependent parameter adjustment is necessary
-        version = self._api.get_info_version().json()['data']['version']
-        if LooseVersion(version) < LooseVersion("6.0"):
-            response = self.data_access_api.get_datafile(fid, is_pid=False)
-        else:
+        if self.server_version >= LooseVersion("6.0"):
             # see https://github.com/datalad/datalad-dataverse/issues/307
-            response = self.data_access_api.get_datafile(fid, is_pid=False, data_format="original")
-        # http error handling
-        response.raise_for_status()
-        with path.open("wb") as f:
-            # accommodate old and newer pydataverse version
-            try:
-                it = response.iter_content
-            except AttributeError:
-                it = response.iter_bytes
-            # `chunk_size=None` means
-            # "read data in whatever size the chunks are received"
-            for chunk in it(chunk_size=None):
-                f.write(chunk)
+            params['format'] = 'original'
+        response = api._request_with_connect_retries(
+            'GET',
+            f'{api.base_url_api_data_access}/datafile/{fid}',
+            params=params,
+            auth=api.auth,
+            follow_redirects=True,
+            stream=True,
+        )
+        try:
+            # http error handling
+            response.raise_for_status()
+            with path.open("wb") as f:
+                for chunk in response.iter_bytes(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        finally:
+            response.close()
 
     def remove_file(self, fid: int):
-        status = delete_request(
+        # use the pooled client of the native API, to not have to
+        # establish a new connection for each removal
+        status = self._api._request_with_connect_retries(
+            'DELETE',
             f'{self._api.base_url}/dvn/api/data-deposit/v1.1/swordv2/'
             f'edit-media/file/{fid}',
             # this relies on having established the NativeApi in prepare()
-            auth=HTTPBasicAuth(self._api.api_token, ''))
+            auth=(self._api.api_token, ''))
         # http error handling
         status.raise_for_status()
         # This ID is not part of the latest version anymore.
-        self._file_records_by_fileid.pop(fid, None)
+        self._pop_file_record(fid)
 
     def upload_file(self,
                     local_path: Path,
                     remote_path: PurePosixPath,
                     replace_id: int | None = None) -> int:
         remote_path = self._mangle_path(remote_path)
-        datafile = Datafile()
-        # remote file metadata
-        datafile.set({
+        name = remote_path.name
+        # remote file metadata. This is what pyDataverse's `Datafile` model
+        # would produce, but without its (costly) schema validation of
+        # these few, always identical properties
+        datafile_json = json.dumps({
             # if we do not give `label`, it would use the local filename
-            'label': remote_path.name,
-            # the model enforces this property, despite `label` being the
-            # effective setter, and despite it being ignore and replaced
-            # we the local filename
-            'filename': remote_path.name,
+            'label': name,
+            # pyDataverse's model enforces this property, despite `label`
+            # being the effective setter, and despite it being ignore and
+            # replaced we the local filename
+            'filename': name,
             'directoryLabel': str(remote_path.parent),
             'pid': self._dsid,
         })
@@ -225,7 +288,7 @@ class OnlineDataverseDataset:
             response = self._api.replace_datafile(
                 identifier=replace_id,
                 filename=local_path,
-                json_str=datafile.json(),
+                json_str=datafile_json,
                 # we are shipping the database fileid (int)
                 is_filepid=False,
             )
@@ -233,7 +296,7 @@ class OnlineDataverseDataset:
             response = self._api.upload_datafile(
                 identifier=self._dsid,
                 filename=local_path,
-                json_str=datafile.json(),
+                json_str=datafile_json,
             )
         response.raise_for_status()
 
@@ -242,19 +305,19 @@ class OnlineDataverseDataset:
         # If we replaced, `replaced_id` is not part of the latest version
         # anymore.
         if replace_id is not None:
-            self._file_records_by_fileid.pop(replace_id, None)
+            self._pop_file_record(replace_id)
 
         upload_rec = response.json()['data']['files'][0]
         uploaded_df = upload_rec['dataFile']
         # update cache:
         # make sure this property actually exists before assigning:
         # (This may happen on `git-annex-copy --fast`)
-        self._file_records_by_fileid[uploaded_df['id']] = FileIdRecord(
-            PurePosixPath(upload_rec.get('directoryLabel', '')) / \
-            uploaded_df['filename'],
+        self._set_file_record(uploaded_df['id'], FileIdRecord(
+            PurePosixPath(
+                upload_rec.get('directoryLabel', ''), uploaded_df['filename']),
             is_released=False,   # We just added - it can't be released
             is_latest_version=True,
-        )
+        ))
         # return the database fileid of the upload
         return uploaded_df['id']
 
@@ -288,18 +351,18 @@ class OnlineDataverseDataset:
         if rename_id is None:
             raise RuntimeError(f"file {rename_path} cannot be renamed")
 
-        datafile = Datafile()
-        datafile.set({
+        name = new_path.name
+        datafile_json = json.dumps({
             # same as with upload `filename` and `label` must be redundant
-            'label': new_path.name,
-            'filename': new_path.name,
+            'label': name,
+            'filename': name,
             'directoryLabel': str(new_path.parent),
             'pid': self._dsid,
         })
 
         response = self.update_file_metadata(
             rename_id,
-            json_str=datafile.json(),
+            json_str=datafile_json,
             is_filepid=False,
         )
         # TODO depending on the release status, we may have to remove
@@ -309,16 +372,15 @@ class OnlineDataverseDataset:
         # the response-content on-success has something like this:
         # b'File Metadata update has been completed:
         #   {"label":"place.txt","directoryLabel":"fresh",...,"id":1845936}
-        # pull it out
-        d = json.loads(
-            re.match(b'.*(?P<rec>{.*})$',
-                     response.content).groupdict()['rec']
-        )
-        self._file_records_by_fileid[d['id']] = FileIdRecord(
-            PurePosixPath(d.get('directoryLabel', '')) / d['label'],
+        # pull it out. The record starts with the first brace, the
+        # message before it has none
+        content = response.content
+        d = json.loads(content[content.index(b'{'):])
+        self._set_file_record(d['id'], FileIdRecord(
+            PurePosixPath(d.get('directoryLabel', ''), d['label']),
             is_released=False,  # We just renamed - it can't be released
             is_latest_version=True,
-        )
+        ))
 
     def update_file_metadata(self,
                              identifier,
@@ -336,7 +398,8 @@ class OnlineDataverseDataset:
         assert self._api.api_token
         headers = {"X-Dataverse-key": self._api.api_token}
 
-        resp = post_request(
+        resp = self._api._request_with_connect_retries(
+            'POST',
             query_str,
             files={'jsonData': (None, json_str.encode())},
             headers=headers
@@ -350,18 +413,33 @@ class OnlineDataverseDataset:
             )
         return resp
 
+    def close(self) -> None:
+        """Close the connections of the (shared) HTTP client of the API"""
+        self._api.http_client.close()
+
     #
     # Helpers
     #
     @property
     def data_access_api(self):
         if self._data_access_api is None:
-            self._data_access_api = DataAccessApi(
-                base_url=self._api.base_url,
-                api_token=self._api.api_token,
-            )
+            # shares the connection pool of the native API
+            self._data_access_api = get_data_access_api(self._api)
         return self._data_access_api
 
+    @property
+    def server_version(self) -> LooseVersion:
+        if self._server_version is None:
+            # the server version determines request parameters for
+            # downloads only, hence it is only requested (once) on demand
+            version_info = self._api.get_info_version().json()
+            if version_info['status'] != 'OK':
+                raise RuntimeError(f'Cannot connect to dataverse instance '
+                                   f'(status: {version_info["status"]})')
+            self._server_version = LooseVersion(
+                version_info['data']['version'])
+        return self._server_version
+
     def _mangle_path(self, path: str | PurePosixPath) -> PurePosixPath:
         if self._root_path:
             # we cannot use mangle_path() directly for type conversion,
@@ -404,20 +482,15 @@ class OnlineDataverseDataset:
         #                'value': 'd8d77109f4a24efc3bd53d7cabb7ee35'},
         #   'creationDate': '2022-07-20'}
 
-        # Sort by version, so we can rely on the last entry to refer to the
-        # latest version.
-        # Note, that ('versionNumber', 'versionMinorNumber', 'versionState')
-        # would look like this:
-        # (None, None, 'DRAFT'), (2, 0, 'RELEASED'), (1, 0, 'RELEASED')
-        # and we need a possible DRAFT to have the greatest key WRT sorting.
-        dataset_versions.sort(
-            key=lambda v: (v.get('versionNumber') or sys.maxsize,
-                           v.get('versionMinorNumber') or sys.maxsize),
-            reverse=False)
+        # Determine the latest version. There is no need to sort all
+        # versions, only the latest one needs to be told apart.
+        latest_version = max(dataset_versions, key=_get_version_key)
         self._file_records = {}
         # iterate over all versions but the latest, and label the records
         # as such
-        for version in dataset_versions[:-1]:
+        for version in dataset_versions:
+            if version is latest_version:
+                continue
             self._file_records.update(
                 self._get_file_records_from_version_listing(
                     version,
@@ -426,52 +499,61 @@ class OnlineDataverseDataset:
             )
         # and the latest version
         self._file_records.update(self._get_file_records_from_version_listing(
-            dataset_versions[-1],
+            latest_version,
             latest=True,
         ))
+        self._index_file_records()
         # set flag to never run this code again
         self._knows_all_versions = True
 
     def _get_file_records_from_version_listing(
             self, version: dict, latest: bool) -> dict:
+        # same for all files of a version
+        released = version['versionState'] == "RELEASED"
         return {
             f['dataFile']['id']: FileIdRecord(
-                PurePosixPath(f.get('directoryLabel', '')) / \
-                f['dataFile']['filename'],
-                version['versionState'] == "RELEASED",
+                # a single path construction, rather than joining two
+                PurePosixPath(
+                    f.get('directoryLabel', ''), f['dataFile']['filename']),
+                released,
                 is_latest_version=latest,
             )
             for f in version['files']
         }
 
-    @property
-    def _file_records_by_fileid(self):
-        """Cache of files in the latest version of the dataverse dataset.
-
-        This refers to the DRAFT version (if there is any) or the latest
-        published version otherwise. That's the version pushes go into. Hence,
-        this is needed to determine whether we need and can replace/remove a
-        file, while the complete list in `self.files_old` is relevant for key
-        retrieval of keys that are not present in the latest version anymore.
-
-        Note, that whie initially we may not be in a draft, we are as soon as we
-        change things (upload/replace/remove/rename). We keep track of those
-        changes herein w/o rerequesting the new state.
-        """
+    def _index_file_records(self) -> None:
+        self._fileids_by_path = {}
+        for fid, rec in self._file_records.items():
+            self._fileids_by_path.setdefault(rec.path, {})[fid] = None
 
-        if self._file_records is None:
-            # we have a clean slate, populate with latest.
-            # if that is not sufficient, callers will need
-            # to call _ensure_file_records_for_all_versions()
-            # first
-            dataset = self._api.get_dataset(
-                identifier=self._dsid,
-                version=":latest",
-            )
-            dataset.raise_for_status()
-            # Latest version in self.dataset is first entry.
-            self._file_records = self._get_file_records_from_version_listing(
-                dataset.json()['data']['latestVersion'],
-                latest=True,
+    def _set_file_record(self, fid: int, rec: FileIdRecord) -> None:
+        prev = self._file_records.get(fid)
+        if prev is not None and prev.path != rec.path:
+            self._unindex_path(prev.path, fid)
+        self._file_records[fid] = rec
+        self._fileids_by_path.setdefault(rec.path, {})[fid] = None
+
+    def _pop_file_record(self, fid: int) -> None:
+        rec = self._file_records.get(fid)
+        if rec is None:
+            return
+        if rec.is_released:
+            # the file is still part of a released version, keep it on
+            # record (and indexed), only not as part of the latest version.
+            # Otherwise a listing of all versions would have to be obtained
+            # (again) to know about it
+            self._file_records[fid] = FileIdRecord(
+                path=rec.path,
+                is_released=True,
+                is_latest_version=False,
             )
-        return self._file_records
+        else:
+            del self._file_records[fid]
+            self._unindex_path(rec.path, fid)
+
+    def _unindex_path(self, path: PurePosixPath, fid: int) -> None:
+        fids = self._fileids_by_path[path]
+        fids.pop(fid, None)
+        if not fids:
+            # no longer any file with this path
+            del self._fileids_by_path[path]
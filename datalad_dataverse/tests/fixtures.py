@@ -1,9 +1,11 @@
 from os import environ
-from pyDataverse.api import DataAccessApi
 
 import pytest
 
-from datalad_dataverse.utils import get_native_api
+from datalad_dataverse.utils import (
+    get_data_access_api,
+    get_native_api,
+)
 
 from .utils import (
     create_test_dataverse_collection,
@@ -39,17 +41,17 @@ def dataverse_instance_url(dataverse_demoinstance_url):
 
 @pytest.fixture(autouse=False, scope="session")
 def dataverse_admin_api(dataverse_admin_token, dataverse_instance_url):
-    return get_native_api(dataverse_instance_url, dataverse_admin_token)
+    api = get_native_api(dataverse_instance_url, dataverse_admin_token)
+    try:
+        yield api
+    finally:
+        # also closes the client shared with `dataverse_dataaccess_api`
+        api.http_client.close()
 
 
 @pytest.fixture(autouse=False, scope="session")
-def dataverse_dataaccess_api(dataverse_admin_token, dataverse_instance_url):
-    # TODO there is no common implementation for this, there should be
-    return DataAccessApi(
-        base_url=dataverse_instance_url,
-        # this relies on having established the NativeApi in prepare()
-        api_token=dataverse_admin_token,
-    )
+def dataverse_dataaccess_api(dataverse_admin_api):
+    return get_data_access_api(dataverse_admin_api)
 
 
 @pytest.fixture(autouse=False, scope='session')
@@ -2,7 +2,10 @@ import pytest
 
 from pathlib import PurePosixPath
 
-from datalad.api import clone
+from datalad.api import (
+    Dataset,
+    clone,
+)
 
 from datalad_next.tests.utils import assert_result_count
 from datalad_next.exceptions import CommandError
@@ -27,6 +30,72 @@ def test_asdv_invalid_calls(
         )
     assert 'Cannot find dataset' in str(ve.value)
 
+    # conflicting sibling names are caught before anything is configured
+    with pytest.raises(ValueError) as ve:
+        ds.add_sibling_dataverse(
+            dv_url=dataverse_instance_url,
+            ds_pid='no-ffing-datalad-way-this-exists',
+            name='dv',
+            storage_name='dv',
+            **ckwa
+        )
+    assert 'must differ' in str(ve.value)
+    assert 'dv' not in ds.repo.get_remotes()
+
+
+def test_asdv_reserved_name(tmp_path):
+    # conflict detection needs no annex
+    ds = Dataset(tmp_path).create(annex=False, **ckwa)
+    # 'here' refers to the local dataset, it cannot be a sibling name
+    with pytest.raises(ValueError) as ve:
+        ds.add_sibling_dataverse(
+            dv_url='https://dv.example.org',
+            ds_pid='doi:10.5072/FK2/WQCBX1',
+            name='here',
+            mode='git-only',
+            **ckwa
+        )
+    assert 'conflicting names' in str(ve.value)
+
+
+def test_asdv_special_remote_conflicts(existing_dataset, tmp_path):
+    ds = existing_dataset
+    for sr in ('dv', 'store'):
+        ds.repo.call_annex([
+            'initremote', sr, 'type=directory', f'directory={tmp_path}',
+            'encryption=none'])
+    # 'dv' is known to git-annex, but not enabled in this clone
+    ds.repo.call_git(['remote', 'remove', 'dv'])
+    assert 'dv' not in ds.repo.get_remotes()
+
+    # the special remote conflicts with a storage sibling of the same name
+    with pytest.raises(ValueError) as ve:
+        ds.add_sibling_dataverse(
+            dv_url='https://dv.example.org',
+            ds_pid='doi:10.5072/FK2/WQCBX1',
+            name='other',
+            storage_name='dv',
+            **ckwa
+        )
+    assert 'conflicting names' in str(ve.value)
+
+    # but not with a Git sibling of that name: only the (existing)
+    # storage sibling is skipped, the Git sibling is added
+    res = ds.add_sibling_dataverse(
+        dv_url='https://dv.example.org',
+        ds_pid='doi:10.5072/FK2/WQCBX1',
+        name='dv',
+        storage_name='store',
+        existing='skip',
+        **ckwa
+    )
+    assert_result_count(
+        res, 1, action='add_sibling_dataverse.storage', status='notneeded',
+        name='store')
+    assert_result_count(
+        res, 1, action='add_sibling_dataverse', status='ok', name='dv')
+    assert 'dv' in ds.repo.get_remotes()
+
 
 @pytest.mark.parametrize("mode", ["annex", "filetree"])
 def test_asdv_addpushclone(
@@ -7,10 +7,16 @@ At least as long as we are using that API layer.
 from pathlib import PurePosixPath
 import json
 
+import httpx
+import pytest
+from pyDataverse.api import NativeApi
+
 from datalad_next.tests.utils import md5sum
 
+from ..baseremote import DataverseRemote
 from ..dataset import OnlineDataverseDataset as ODD
 from ..utils import mangle_path
+from .utils import get_mock_native_api
 
 
 def test_file_handling(
@@ -241,3 +247,194 @@ def test_name_mangling(
         check_rename_file(odd, fileid, name="ren" + path.name)
         check_remove(odd, fileid, PurePosixPath(path.name))
         check_duplicate_file_deposition(odd, tmp_path)
+
+
+def test_offline_latest_version_records(tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if '/access/datafile/' in request.url.path:
+            assert request.url.params['format'] == 'original'
+            return httpx.Response(200, content=b'payload')
+        if request.url.path.endswith('/info/version'):
+            return httpx.Response(
+                200, json={'status': 'OK', 'data': {'version': '6.1'}})
+        assert request.url.path.endswith('/versions/:latest')
+        assert request.url.params['persistentId'] == 'doi:10.5072/FK2/WQCBX1'
+        return httpx.Response(200, json={'status': 'OK', 'data': {
+            'versionState': 'DRAFT',
+            'files': [
+                {'directoryLabel': 'annex',
+                 'dataFile': {'id': 1, 'filename': 'key1'}},
+                {'dataFile': {'id': 2, 'filename': 'top.txt'}},
+            ],
+        }})
+
+    odd = ODD(get_mock_native_api(handler), 'doi:10.5072/FK2/WQCBX1')
+    # a single request to get the listing of the latest version
+    assert len(requests) == 1
+    n_requests = len(requests)
+    assert odd.has_fileid_in_latest_version(1)
+    assert odd.has_path_in_latest_version(PurePosixPath('annex', 'key1'))
+    assert odd.get_fileid_from_path(
+        PurePosixPath('top.txt'), latest_only=True) == 2
+    assert not odd.is_released_file(2)
+    assert not odd.has_fileid_in_latest_version(3)
+    # the latest version listing is known from the initial dataset request
+    assert len(requests) == n_requests
+    # downloads go through the same (mocked) connection pool
+    for i in range(2):
+        odd.download_file(2, tmp_path / 'downloaded')
+        assert (tmp_path / 'downloaded').read_bytes() == b'payload'
+    # and the server version is requested only once, on demand
+    assert requests[n_requests:] == \
+        ['/api/v1/info/version'] + ['/api/access/datafile/2'] * 2
+    # closing the dataset closes the client shared by both APIs, also
+    # when done by the special remote on shutdown
+    remote = DataverseRemote(None)
+    remote._dvds = odd
+    remote.close()
+    assert remote._dvds is None
+    assert odd.data_access_api.http_client.is_closed
+
+
+def test_offline_path_index(tmp_path):
+    uploads = iter((3, 4))
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        if request.url.path.endswith('/metadata'):
+            assert request.headers['X-Dataverse-key'] == 'token'
+            return httpx.Response(
+                200,
+                content=b'File Metadata update has been completed: '
+                        b'{"label":"renamed.txt","categories":["a"],"id":3}')
+        if request.method == 'POST':
+            # both new uploads and replacements report the new file record
+            label = 'new.txt' if request.url.path.endswith('/add') \
+                else 'top.txt'
+            return httpx.Response(200, json={'status': 'OK', 'data': {
+                'files': [{'dataFile': {'id': next(uploads),
+                                        'filename': label}}],
+            }})
+        return httpx.Response(200, json={'status': 'OK', 'data': {
+            'versionState': 'RELEASED',
+            'files': [
+                {'dataFile': {'id': 2, 'filename': 'top.txt'}},
+            ],
+        }})
+
+    odd = ODD(get_mock_native_api(handler), 'doi:10.5072/FK2/WQCBX1')
+    upload = tmp_path / 'upload'
+    upload.write_text('content')
+
+    new_path = PurePosixPath('new.txt')
+    top_path = PurePosixPath('top.txt')
+    assert not odd.has_path_in_latest_version(new_path)
+    assert odd.upload_file(upload, new_path) == 3
+    assert odd.has_path_in_latest_version(new_path)
+    assert odd.get_fileid_from_path(new_path, latest_only=True) == 3
+
+    assert odd.get_fileid_from_path(top_path, latest_only=True) == 2
+    assert odd.upload_file(upload, top_path, replace_id=2) == 4
+    # the path now points to the replacement only
+    assert odd.get_fileid_from_path(top_path, latest_only=True) == 4
+    assert not odd.has_fileid_in_latest_version(2)
+
+    renamed_path = PurePosixPath('renamed.txt')
+    odd.rename_file(renamed_path, rename_path=new_path)
+    assert not odd.has_path_in_latest_version(new_path)
+    assert odd.get_fileid_from_path(renamed_path, latest_only=True) == 3
+
+    odd.remove_file(4)
+    assert odd.get_fileid_from_path(top_path, latest_only=True) is None
+    # renaming and removal go through the same (mocked) connection pool
+    assert requests[-2:] == [
+        ('POST', '/api/v1/files/3/metadata'),
+        ('DELETE',
+         '/dvn/api/data-deposit/v1.1/swordv2/edit-media/file/4'),
+    ]
+
+
+def test_offline_all_versions_records():
+    def _version(major, minor, fid):
+        return {'versionNumber': major, 'versionMinorNumber': minor,
+                'versionState': 'RELEASED',
+                'files': [{'dataFile': {'id': fid, 'filename': 'f.txt'}}]}
+
+    def handler(request):
+        if request.url.path.endswith('/versions'):
+            # not ordered by version
+            return httpx.Response(200, json={'status': 'OK', 'data': [
+                _version(1, 1, 5), _version(1, 0, 4)]})
+        return httpx.Response(
+            200, json={'status': 'OK', 'data': _version(1, 1, 5)})
+
+    odd = ODD(get_mock_native_api(handler), 'doi:10.5072/FK2/WQCBX1')
+    path = PurePosixPath('f.txt')
+    assert odd.has_fileid(4)
+    assert odd.has_path(path)
+    # 1.1 is the latest version, despite a minor version number of 0
+    # for 1.0
+    assert odd.has_fileid_in_latest_version(5)
+    assert not odd.has_fileid_in_latest_version(4)
+    assert odd.get_fileid_from_path(path, latest_only=False) == 5
+
+
+def test_offline_first_release_records():
+    requests = []
+    release = {
+        'versionNumber': 1, 'versionMinorNumber': 0,
+        'versionState': 'RELEASED',
+        'files': [{'dataFile': {'id': 4, 'filename': 'f.txt'}}],
+    }
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        if request.url.path.endswith('/versions'):
+            return httpx.Response(
+                200, json={'status': 'OK', 'data': [release]})
+        return httpx.Response(200, json={'status': 'OK', 'data': release})
+
+    odd = ODD(get_mock_native_api(handler), 'doi:10.5072/FK2/WQCBX1')
+    # with the first release being the latest version, there are no other
+    # versions to ask for
+    assert not odd.has_fileid(5)
+    assert not odd.has_path(PurePosixPath('other.txt'))
+    assert len(requests) == 1
+    # a removed file is still part of the release, and is known to be,
+    # without asking for a full version listing
+    odd.remove_file(4)
+    assert not odd.has_fileid_in_latest_version(4)
+    assert odd.has_fileid(4)
+    assert odd.is_released_file(4)
+    assert odd.has_path(PurePosixPath('f.txt'))
+    assert not odd.has_path_in_latest_version(PurePosixPath('f.txt'))
+    assert odd.get_fileid_from_path(
+        PurePosixPath('f.txt'), latest_only=False) == 4
+    assert not any(r.endswith('/versions') for r in requests)
+
+
+@pytest.mark.parametrize(
+    "status,msg",
+    [(403, 'Not permitted'), (404, 'Cannot find dataset')])
+def test_offline_dataset_access_errors(status, msg):
+    def handler(request):
+        return httpx.Response(
+            status, json={'status': 'ERROR', 'message': 'nope'})
+
+    with pytest.raises(RuntimeError) as e:
+        ODD(get_mock_native_api(handler), 'doi:10.5072/FK2/WQCBX1')
+    assert msg in str(e.value)
+
+
+def test_offline_requires_pooled_api():
+    with pytest.raises(TypeError):
+        ODD(NativeApi('https://dv.example.org', 'token'),
+            'doi:10.5072/FK2/WQCBX1')
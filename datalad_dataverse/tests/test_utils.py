@@ -1,8 +1,14 @@
+import threading
 import unicodedata
 import unicodedata
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
 from itertools import product
 from pathlib import PurePosixPath
 
+import httpx
 import pytest
 
 from ..utils import (
@@ -10,9 +16,12 @@ from ..utils import (
     _dataverse_filename_quote,
     _dataverse_unquote,
     format_doi,
+    get_data_access_api,
+    get_native_api,
     mangle_path,
     unmangle_path
 )
+from .utils import get_mock_native_api
 
 
 dog_cat = unicodedata.lookup('dog face') + unicodedata.lookup('cat face')
@@ -88,3 +97,106 @@ def test_unicode_quoting_leading_dot():
         q = _dataverse_dirname_quote(p)
         assert q[0] not in (".", "-", " ")
         assert p == _dataverse_unquote(q)
+
+
+def test_native_api_shared_client():
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={'status': 'OK', 'data': {}})
+
+    api = get_mock_native_api(handler)
+    api.get_info_version()
+    api.get_dataset('doi:10.5072/FK2/WQCBX1')
+    api.delete_dataset('doi:10.5072/FK2/WQCBX1')
+    # all requests went through the shared client
+    assert [r[0] for r in requests] == ['GET', 'GET', 'DELETE']
+    assert requests[0][1] == '/api/v1/info/version'
+
+
+def test_native_api_no_timeout():
+    api = get_native_api('https://dv.example.org', 'token')
+    # also applies to requests made with the client directly, not only
+    # to those made via pyDataverse
+    assert api.http_client.timeout == httpx.Timeout(None)
+    assert get_data_access_api(api).http_client is api.http_client
+    api.http_client.close()
+
+
+def test_native_api_connect_retries():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.url.path)
+        if len(attempts) <= 2:
+            raise httpx.ConnectError('refused', request=request)
+        return httpx.Response(200, json={'status': 'OK', 'data': {}})
+
+    api = get_mock_native_api(handler)
+    api.get_info_version()
+    assert len(attempts) == 3
+    # the same applies to requests sent with the pooled client directly
+    attempts.clear()
+    resp = api._request_with_connect_retries(
+        'DELETE', 'https://dv.example.org/dvn/api/file/1', stream=True)
+    resp.close()
+    assert len(attempts) == 3
+    # give up eventually
+    attempts.clear()
+    api.connect_retries = 0
+    with pytest.raises(httpx.ConnectError):
+        api.get_info_version()
+    assert len(attempts) == 1
+
+
+@pytest.fixture
+def recording_http_server():
+    """Local HTTP server that records the request target of each request"""
+    targets = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            targets.append(self.path)
+            body = b'{"status": "OK", "data": {}}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}', targets
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_native_api_honors_env_proxy(monkeypatch, recording_http_server):
+    proxy_url, targets = recording_http_server
+    for var in ('ALL_PROXY', 'HTTPS_PROXY', 'NO_PROXY'):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+    monkeypatch.setenv('HTTP_PROXY', proxy_url)
+    monkeypatch.setenv('http_proxy', proxy_url)
+
+    api = get_native_api('http://dv.example.org', 'token')
+    api.get_info_version()
+    api.http_client.close()
+    # the request was sent to the proxy, asking it to forward it
+    assert targets == ['http://dv.example.org/api/v1/info/version']
+
+    # hosts excluded via NO_PROXY are contacted directly
+    targets.clear()
+    monkeypatch.setenv('NO_PROXY', '127.0.0.1')
+    monkeypatch.setenv('no_proxy', '127.0.0.1')
+    api = get_native_api(proxy_url, 'token')
+    api.get_info_version()
+    api.http_client.close()
+    assert targets == ['/api/v1/info/version']
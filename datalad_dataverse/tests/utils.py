@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import requests
 
+import httpx
+
 from pyDataverse.models import (
     Dataverse,
     Dataset as DvDataset,
@@ -11,14 +13,41 @@ from pyDataverse.exceptions import OperationFailedError
 
 from datalad_next.exceptions import CapturedException
 
+from datalad_dataverse.utils import get_native_api
+
 
 class InvalidDatasetMetadata(ValueError):
     pass
 
 
+def get_mock_native_api(handler):
+    """Native API handle that sends all requests to ``handler()``
+
+    ``handler`` is called with an ``httpx.Request`` and must return an
+    ``httpx.Response``. No network access is involved.
+    """
+    return get_native_api(
+        'https://dv.example.org',
+        'token',
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+# collection records by (instance URL, alias). Collection metadata does not
+# change during a test session, no need to request it for every test dataset
+_dv_collections = {}
+
+# parsed example dataset metadata by URL, it is the same for every test
+# dataset, no need to download and parse it again
+_dv_dataset_metas = {}
+
+
 def _get_dv_collection(api, alias):
     # TODO: this should be able to deal with different identifiers not just the
     # alias, I guess
+    cache_key = (api.base_url, alias)
+    if cache_key in _dv_collections:
+        return _dv_collections[cache_key]
     try:
         response = api.get_dataverse(alias)
     except OperationFailedError as e:
@@ -49,7 +78,9 @@ def _get_dv_collection(api, alias):
     # we are only catching the pyDataverse error above
     # be safe and error for any request failure too
     response.raise_for_status()
-    return response.json()
+    collection = response.json()
+    _dv_collections[cache_key] = collection
+    return collection
 
 
 def _create_dv_dataset(api, collection, dataset_meta):
@@ -110,7 +141,10 @@ def create_test_dataverse_dataset(api, collection, name):
     # demo.dataverse.org
     current_meta_example = \
         "https://guides.dataverse.org/en/latest/_downloads/fc56af1c414df69fd4721ce3629f0c03/dataset-finch1.json"
-    meta = json.loads(requests.get(current_meta_example).text)
+    meta = _dv_dataset_metas.get(current_meta_example)
+    if meta is None:
+        meta = requests.get(current_meta_example).json()
+        _dv_dataset_metas[current_meta_example] = meta
     col = _get_dv_collection(api, collection)
     req = _create_dv_dataset(api, col, meta)
     req.raise_for_status()
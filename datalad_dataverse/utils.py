@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import re
-from pathlib import (
-    Path,
-    PurePosixPath,
-)
-
-from pyDataverse.api import NativeApi
+from pathlib import PurePosixPath
 
-from datalad_next.utils import update_specialremote_credential
+import httpx
+from pyDataverse.api import (
+    DataAccessApi,
+    NativeApi,
+)
 
 
 __docformat__ = "numpy"
@@ -43,14 +43,127 @@ TO_ENCODE = {
 TO_DECODE = {v: k for k, v in TO_ENCODE.items()}
 
 
-def get_native_api(baseurl, token):
+class _PooledApiMixin:
+    """Send all synchronous pyDataverse requests via one ``httpx.Client``
+
+    pyDataverse uses the module-level ``httpx.get()`` & friends for its
+    synchronous requests, which open (and tear down) a fresh connection for
+    every single API call. All calls of an instance target the same host,
+    hence we route them through a shared client that keeps connections alive
+    and avoids a TCP+TLS handshake per request. Requests that failed to
+    establish a connection are retried a few times, before they are given up
+    on.
     """
+    # number of additional attempts to connect for a single request
+    connect_retries = 2
+
+    def __init__(self, *args, http_client=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # no custom transport, it would disable the use of any proxy
+        # configured via the environment (HTTP(S)_PROXY, NO_PROXY)
+        self.http_client = http_client or httpx.Client(
+            # like pyDataverse's own requests, also for any direct use
+            # of the client, e.g. for SWORD API requests
+            timeout=None,
+        )
+
+    def _sync_request(self, method, **kwargs):
+        # `method` is one of `httpx.get/post/put/delete`, map it onto
+        # the equivalent method of the pooled client
+        return self._with_connect_retries(
+            super()._sync_request,
+            getattr(self.http_client, method.__name__),
+            **kwargs,
+        )
+
+    def _request_with_connect_retries(
+            self, method: str, url: str, *, stream: bool = False, **kwargs):
+        """Send a request with the pooled client directly
+
+        This is for requests pyDataverse has no method for. They are subject
+        to the same connection retries as any request made via pyDataverse.
+
+        Parameters
+        ----------
+        method: str
+          HTTP method, e.g. ``'GET'``.
+        url: str
+        stream: bool, optional
+          If set, the response body is not read. The caller must close the
+          response.
+        **kwargs:
+          Passed on to ``httpx.Client.build_request()``, except for ``auth``
+          and ``follow_redirects``, which are passed on to
+          ``httpx.Client.send()``.
+
+        Returns
+        -------
+        httpx.Response
+        """
+        send_kwargs = {
+            k: kwargs.pop(k) for k in ('auth', 'follow_redirects')
+            if k in kwargs
+        }
+        request = self.http_client.build_request(method, url, **kwargs)
+        return self._with_connect_retries(
+            self.http_client.send, request, stream=stream, **send_kwargs)
+
+    def _with_connect_retries(self, call, *args, **kwargs):
+        for attempt in range(self.connect_retries + 1):
+            try:
+                return call(*args, **kwargs)
+            except httpx.ConnectError:
+                # nothing was sent, hence it is safe to retry even
+                # non-idempotent requests
+                if attempt == self.connect_retries:
+                    raise
+
+
+class _PooledNativeApi(_PooledApiMixin, NativeApi):
+    pass
+
+
+class _PooledDataAccessApi(_PooledApiMixin, DataAccessApi):
+    pass
+
+
+def get_native_api(baseurl, token, http_client=None):
+    """
+    Parameters
+    ----------
+    baseurl: str
+    token: str
+    http_client: httpx.Client, optional
+      Client to send all requests with. By default, a new one is created.
+      Whoever owns the API instance is responsible for closing it.
+
     Returns
     -------
     NativeApi
-      The pyDataverse API wrapper
+      The pyDataverse API wrapper. All requests made through this instance
+      share a pool of persistent connections.
+    """
+    return _PooledNativeApi(baseurl, token, http_client=http_client)
+
+
+def get_data_access_api(native_api):
+    """
+    Parameters
+    ----------
+    native_api: NativeApi
+      API instance created by ``get_native_api()``. Its instance URL,
+      token, and connection pool are shared.
+
+    Returns
+    -------
+    DataAccessApi
+      The pyDataverse data access API wrapper.
     """
-    return NativeApi(baseurl, token)
+    return _PooledDataAccessApi(
+        native_api.base_url,
+        native_api.api_token,
+        http_client=native_api.http_client,
+    )
 
 
 def format_doi(doi_in: str) -> str:
@@ -94,6 +207,9 @@ def format_doi(doi_in: str) -> str:
     return f'doi:{doi_in}'
 
 
+# the same paths are mangled over and over again, e.g. for each query
+# of a special remote on a particular key, and results are immutable
+@lru_cache(maxsize=4096)
 def mangle_path(path: str | PurePosixPath) -> PurePosixPath:
     """Quote unsupported chars in all elements of a path
 